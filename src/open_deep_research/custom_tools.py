@@ -1,137 +1,733 @@
 """Custom tool implementations for Open Deep Research."""
 
+import asyncio
+import codecs
+import functools
+import importlib.util
+import inspect
 import json
 import os
 import re
+import threading
 import urllib.parse
-import urllib.request
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
+import aiohttp
+import httpx
 import requests
 from bs4 import BeautifulSoup
-from langchain_core.tools import tool
+from bs4.dammit import EncodingDetector
+from cachetools import TTLCache
+from langchain_core.tools import StructuredTool
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@tool
-def google_cse_search(query: str, num: int = 5, start: int = 1) -> str:
-    """Search via Google Custom Search JSON API and return top results.
 
-    This tool uses Google's Custom Search Engine to find relevant web pages.
-    Requires GOOGLE_SEARCH_JSON_API_KEY and GOOGLE_CSE_ID environment variables.
-    
-    Args:
-        query: Search query string
-        num: Number of results to return (1-10, default: 5)
-        start: Starting index for results (default: 1)
-    
-    Returns:
-        JSON string with search results containing title, link, snippet, and displayLink
+def _dumps(obj, pretty: bool = False) -> str:
+    """Serialize a tool result to a JSON string, preferring orjson when available.
+
+    Output is compact by default: indentation roughly doubles the size of the
+    text handed back to the model without making it any easier to read.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from lxml import etree as ET
+except ImportError:
+    from xml.etree import ElementTree as ET
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import aiohttp_client_cache
+except ImportError:
+    aiohttp_client_cache = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# simdjson parsers reuse an internal buffer and invalidate previously returned
+# documents on every parse, so each worker thread gets its own instance.
+_simdjson_local = threading.local()
+
+
+def _parse_cse_items(body: bytes) -> list[dict]:
+    """Extract the fields we report from a Google CSE response body.
+
+    With simdjson only the four accessed keys per item are materialized as
+    Python objects; the rest of each item (pagemap, htmlSnippet, ...) is skipped.
+    """
+    if simdjson is None:
+        items = _loads(body).get("items", []) or []
+    else:
+        parser = getattr(_simdjson_local, "parser", None)
+        if parser is None:
+            parser = _simdjson_local.parser = simdjson.Parser()
+        items = parser.parse(body).get("items") or []
+
+    return [
+        {
+            "title": item.get("title"),
+            "link": item.get("link"),
+            "snippet": item.get("snippet"),
+            "displayLink": item.get("displayLink"),
+        }
+        for item in items
+    ]
+
+
+##########################
+# Result Caching
+##########################
+# Agents often repeat the same lookup within a session, so successful results of
+# the API-backed tools are kept for ten minutes. Sync and async variants of a
+# tool share one cache.
+_CACHE_LOCK = threading.Lock()
+_GOOGLE_CSE_CACHE = TTLCache(maxsize=1024, ttl=600)
+_WIKIPEDIA_CACHE = TTLCache(maxsize=1024, ttl=600)
+_ARXIV_CACHE = TTLCache(maxsize=1024, ttl=600)
+
+
+def _is_error(result: str) -> bool:
+    """Return True if a tool result is an error payload."""
+    return result.startswith('{"error"')
+
+
+def _cached(cache: TTLCache):
+    """Memoize a tool implementation's successful results, keyed on its bound arguments.
+
+    Error payloads are not cached so transient failures are retried on the next call.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def make_key(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return tuple(bound.arguments.items())
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                with _CACHE_LOCK:
+                    result = cache.get(key)
+                if result is None:
+                    result = await func(*args, **kwargs)
+                    if not _is_error(result):
+                        with _CACHE_LOCK:
+                            cache[key] = result
+                return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            with _CACHE_LOCK:
+                result = cache.get(key)
+            if result is None:
+                result = func(*args, **kwargs)
+                if not _is_error(result):
+                    with _CACHE_LOCK:
+                        cache[key] = result
+            return result
+        return wrapper
+    return decorator
+
+
+##########################
+# HTTP Clients
+##########################
+_ODR_HEADERS = {"User-Agent": "OpenDeepResearch/1.0"}
+_BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+}
+
+# Wikipedia and arXiv API responses are kept in a persistent SQLite cache
+# honoring Cache-Control, so repeat lookups survive restarts. The sync tools use
+# requests-cache and the async ones aiohttp-client-cache (both in the 'fast'
+# extra); without them responses are simply not stored. Only those API
+# endpoints are matched: fetched pages (even on the same hosts) and Google CSE
+# (quota-tracked) are never written to it, and fetch_url_content keeps its byte
+# cap since the cache reads the full body of any response it stores.
+_HTTP_CACHE_ENDPOINTS = (
+    ("en.wikipedia.org", "/api/rest_v1/page/summary/"),
+    ("export.arxiv.org", "/api/query"),
+)
+_HTTP_CACHE_DIR = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+_HTTP_CACHE_EXPIRE_AFTER = 3600
+
+
+def _is_cacheable_response(response) -> bool:
+    """Return True if a response comes from an API endpoint whose results we cache on disk.
+
+    Accepts both requests and aiohttp responses.
     """
+    parts = urllib.parse.urlsplit(str(response.url))
+    return any(
+        parts.hostname == host and parts.path.startswith(path)
+        for host, path in _HTTP_CACHE_ENDPOINTS
+    )
+
+
+if requests_cache is not None:
+    _SESSION = requests_cache.CachedSession(
+        "odr_http_cache",
+        backend="sqlite",
+        use_cache_dir=True,
+        expire_after=_HTTP_CACHE_EXPIRE_AFTER,
+        cache_control=True,
+        allowable_methods=("GET",),
+        filter_fn=_is_cacheable_response,
+    )
+else:
+    _SESSION = requests.Session()
+# Only GETs are retried on read errors, so fetch_url_content's HEAD pre-check
+# stays a single round trip even against a server that stalls on HEAD
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.2, allowed_methods=frozenset({"GET"})),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Google CSE is served over HTTP/2; shared httpx clients multiplex requests
+# (including batch_search fan-out) over one warm TLS connection. HTTP/2 support
+# needs the optional h2 package.
+_HTTPX_OPTIONS = {
+    "http2": importlib.util.find_spec("h2") is not None,
+    "timeout": 20,
+    "headers": _ODR_HEADERS,
+}
+_HTTPX_CLIENT = httpx.Client(**_HTTPX_OPTIONS)
+
+
+def _per_loop(factory):
+    """Share one async client per event loop and close it when the loop shuts down.
+
+    Async clients are bound to the loop they were created on, so each loop gets
+    its own. factory returns the client and the coroutine function closing it;
+    the close runs from the finally block of an async generator parked on the
+    loop, which the loop finalizes during shutdown (asyncio.run calls
+    shutdown_asyncgens before closing the loop).
+    """
+    clients = weakref.WeakKeyDictionary()
+
+    async def lifetime(close):
+        try:
+            yield
+        finally:
+            clients.pop(asyncio.get_running_loop(), None)
+            await close()
+
+    @functools.wraps(factory)
+    async def get():
+        loop = asyncio.get_running_loop()
+        entry = clients.get(loop)
+        if entry is None:
+            client, close = factory()
+            keeper = lifetime(close)
+            await keeper.__anext__()
+            entry = clients[loop] = (client, keeper)
+        return entry[0]
+    return get
+
+
+@_per_loop
+def _get_aiohttp_session():
+    """Return the pooled aiohttp session for the running event loop."""
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=1024, limit_per_host=64)
+    )
+    return session, session.close
+
+
+@_per_loop
+def _get_httpx_async_client():
+    """Return the shared HTTP/2 httpx client for the running event loop."""
+    client = httpx.AsyncClient(**_HTTPX_OPTIONS)
+    return client, client.aclose
+
+
+@_per_loop
+def _get_aiohttp_cached_session():
+    """Return the aiohttp session backed by the persistent HTTP cache for the running loop."""
+    session = aiohttp_client_cache.CachedSession(
+        cache=aiohttp_client_cache.SQLiteBackend(
+            os.path.join(_HTTP_CACHE_DIR, "odr_aiohttp_cache"),
+            expire_after=_HTTP_CACHE_EXPIRE_AFTER,
+            cache_control=True,
+            allowed_methods=("GET",),
+            filter_fn=_is_cacheable_response,
+        ),
+        connector=aiohttp.TCPConnector(limit=1024, limit_per_host=64),
+    )
+    return session, session.close
+
+
+async def _aget(
+    url: str,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    timeout: float = 20,
+    cached: bool = False,
+) -> bytes:
+    """GET a URL on the shared aiohttp session and return the raw response body.
+
+    With cached=True the request goes through the persistent HTTP cache, if installed.
+    """
+    if cached and aiohttp_client_cache is not None:
+        session = await _get_aiohttp_cached_session()
+    else:
+        session = await _get_aiohttp_session()
+    async with session.get(
+        url,
+        params=params,
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as response:
+        response.raise_for_status()
+        return await response.read()
+
+
+##########################
+# Google Custom Search
+##########################
+def _google_cse_params(query: str, num: int, start: int) -> Optional[dict]:
+    """Build Google CSE query parameters, or None if credentials are missing."""
     api_key = os.getenv("GOOGLE_SEARCH_JSON_API_KEY")
     cx = os.getenv("GOOGLE_CSE_ID")
     
     if not api_key or not cx:
-        return json.dumps({
-            "error": "Missing environment variables: GOOGLE_SEARCH_JSON_API_KEY or GOOGLE_CSE_ID"
-        })
+        return None
 
     # Validate and clamp parameters
     num = max(1, min(10, int(num)))
     start = max(1, int(start))
 
-    params = {
+    return {
         "key": api_key,
         "cx": cx,
         "q": query,
         "num": str(num),
         "start": str(start),
     }
-    url = f"https://www.googleapis.com/customsearch/v1?{urllib.parse.urlencode(params)}"
+
+
+def _redact_key(message: str, params: dict) -> str:
+    """Mask the API key in error messages that echo the request URL."""
+    return message.replace(params["key"], "***")
+
+
+@_cached(_GOOGLE_CSE_CACHE)
+def _google_cse_search(query: str, num: int = 5, start: int = 1, pretty: bool = False) -> str:
+    """Search via Google Custom Search JSON API and return top results.
+
+    This tool uses Google's Custom Search Engine to find relevant web pages.
+    Requires GOOGLE_SEARCH_JSON_API_KEY and GOOGLE_CSE_ID environment variables.
+    
+    Args:
+        query: Search query string
+        num: Number of results to return (1-10, default: 5)
+        start: Starting index for results (default: 1)
+        pretty: Indent the JSON output for human reading (default: False)
+    
+    Returns:
+        JSON string with search results containing title, link, snippet, and displayLink
+    """
+    params = _google_cse_params(query, num, start)
+    if params is None:
+        return _dumps({
+            "error": "Missing environment variables: GOOGLE_SEARCH_JSON_API_KEY or GOOGLE_CSE_ID"
+        })
 
     try:
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            body = resp.read()
-        
-        data = json.loads(body)
-        items = data.get("items", []) or []
+        response = _HTTPX_CLIENT.get(
+            "https://www.googleapis.com/customsearch/v1",
+            params=params
+        )
+        response.raise_for_status()
         
         # Format results consistently
-        formatted = [
-            {
-                "title": item.get("title"),
-                "link": item.get("link"),
-                "snippet": item.get("snippet"),
-                "displayLink": item.get("displayLink"),
-            }
-            for item in items
+        formatted = _parse_cse_items(response.content)
+        
+        return _dumps({"items": formatted}, pretty=pretty)
+        
+    except Exception as e:
+        return _dumps({"error": f"Search failed: {_redact_key(str(e), params)}"})
+
+
+@_cached(_GOOGLE_CSE_CACHE)
+async def _google_cse_search_async(
+    query: str, num: int = 5, start: int = 1, pretty: bool = False
+) -> str:
+    """Async variant of _google_cse_search using the shared async httpx client."""
+    params = _google_cse_params(query, num, start)
+    if params is None:
+        return _dumps({
+            "error": "Missing environment variables: GOOGLE_SEARCH_JSON_API_KEY or GOOGLE_CSE_ID"
+        })
+
+    try:
+        client = await _get_httpx_async_client()
+        response = await client.get(
+            "https://www.googleapis.com/customsearch/v1",
+            params=params
+        )
+        response.raise_for_status()
+        return _dumps({"items": _parse_cse_items(response.content)}, pretty=pretty)
+    except Exception as e:
+        return _dumps({"error": f"Search failed: {_redact_key(str(e), params)}"})
+
+
+google_cse_search = StructuredTool.from_function(
+    func=_google_cse_search,
+    coroutine=_google_cse_search_async,
+    name="google_cse_search",
+)
+
+
+# Searches are I/O-bound, so batched queries run on threads that release the GIL
+# while waiting on the network.
+_BATCH_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="odr-batch")
+
+# Each query is a paid CSE call, so a single tool call may only fan out this far
+_MAX_BATCH_QUERIES = 10
+
+
+def _batch_size_error(queries: List[str]) -> Optional[str]:
+    """Return an error payload if a batch has more queries than allowed."""
+    if len(queries) > _MAX_BATCH_QUERIES:
+        return _dumps({
+            "error": f"Too many queries: {len(queries)} (maximum {_MAX_BATCH_QUERIES} per batch)"
+        })
+    return None
+
+
+def _format_batch_results(queries: List[str], results: List[str], pretty: bool) -> str:
+    """Combine per-query search results into one JSON payload."""
+    return _dumps({
+        "results": [
+            {"query": query, **_loads(result)}
+            for query, result in zip(queries, results)
         ]
+    }, pretty=pretty)
+
+
+def _batch_search(queries: List[str], num: int = 5, pretty: bool = False) -> str:
+    """Run several Google Custom Search queries concurrently.
+
+    Use this tool instead of repeated google_cse_search calls when you have
+    multiple independent queries to look up at once.
+    
+    Args:
+        queries: List of search query strings (at most 10)
+        num: Number of results to return per query (1-10, default: 5)
+        pretty: Indent the JSON output for human reading (default: False)
+    
+    Returns:
+        JSON string with one entry per query containing its items or an error message
+    """
+    error = _batch_size_error(queries)
+    if error:
+        return error
+    futures = [_BATCH_POOL.submit(_google_cse_search, query, num) for query in queries]
+    return _format_batch_results(queries, [future.result() for future in futures], pretty)
+
+
+async def _batch_search_async(queries: List[str], num: int = 5, pretty: bool = False) -> str:
+    """Async variant of _batch_search that gathers the async searches."""
+    error = _batch_size_error(queries)
+    if error:
+        return error
+    results = await asyncio.gather(
+        *(_google_cse_search_async(query, num) for query in queries)
+    )
+    return _format_batch_results(queries, results, pretty)
+
+
+batch_search = StructuredTool.from_function(
+    func=_batch_search,
+    coroutine=_batch_search_async,
+    name="batch_search",
+)
+
+
+##########################
+# URL Content Fetching
+##########################
+# Pages are streamed and cut off once enough HTML has arrived to yield
+# max_chars of text. The floor keeps script-heavy pages, whose <head> alone can
+# run to hundreds of KB, from being truncated before any body text.
+_HTML_BYTES_PER_CHAR = 8
+_MIN_DOWNLOAD_BYTES = 512 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+# Bodies below this size with no "<" anywhere are used as-is. The whole body is
+# checked, since markup can follow leading whitespace or a byte-order mark.
+_PLAIN_TEXT_MAX_BYTES = 2048
+
+
+# A HEAD request screens out binaries and huge files before the GET. Any text
+# format is fetched (text/*, JSON and XML variants); servers that omit
+# Content-Type, or reject HEAD altogether, still get a normal fetch.
+_MAX_CONTENT_LENGTH = 10_000_000
+
+
+def _is_text_content_type(content_type: str) -> bool:
+    """Return True if a bare, lowercased media type is textual enough to extract."""
+    return (
+        not content_type
+        or content_type.startswith("text/")
+        or content_type in ("application/xml", "application/json")
+        or content_type.endswith(("+xml", "+json"))
+    )
+
+
+def _check_fetchable(headers) -> Optional[str]:
+    """Return an error message if HEAD response headers rule out text extraction."""
+    content_type = headers.get("Content-Type", "").split(";")[0].strip().lower()
+    if not _is_text_content_type(content_type):
+        return f"Unsupported content type: {content_type}"
+    content_length = headers.get("Content-Length", "")
+    if content_length.isdigit() and int(content_length) > _MAX_CONTENT_LENGTH:
+        return "Resource too large"
+    return None
+
+
+def _download_cap(max_chars: int) -> int:
+    """Return the number of HTML bytes to read for max_chars of text."""
+    return max(max_chars * _HTML_BYTES_PER_CHAR, _MIN_DOWNLOAD_BYTES)
+
+
+def _decode_html(body: bytes, charset: Optional[str] = None) -> str:
+    """Decode an HTML body using the header or declared charset, defaulting to UTF-8.
+
+    UTF-8 is decoded as utf-8-sig so a leading BOM does not end up in the text.
+    """
+    encoding = charset or EncodingDetector.find_declared_encoding(body, is_html=True) or "utf-8"
+    try:
+        if codecs.lookup(encoding).name == "utf-8":
+            encoding = "utf-8-sig"
+    except LookupError:
+        encoding = "utf-8-sig"
+    return body.decode(encoding, errors="replace")
+
+
+def _extract_text(
+    url: str,
+    body: bytes,
+    max_chars: int,
+    charset: Optional[str] = None,
+    pretty: bool = False,
+    truncated: bool = False,
+) -> str:
+    """Strip markup from an HTML document and return the readable text as JSON.
+
+    truncated marks a body cut off at the download cap; if no text survives
+    extraction, an error is returned rather than empty content.
+    """
+    try:
+        if len(body) < _PLAIN_TEXT_MAX_BYTES and b"<" not in body:
+            # Plain text or a terse error page; skip the parser bootstrap entirely
+            text = _decode_html(body, charset)
+        elif LexborHTMLParser is not None:
+            # Lexbor treats raw bytes as UTF-8, so decode with the right charset first
+            tree = LexborHTMLParser(_decode_html(body, charset))
+            
+            # Remove script, style, and noscript tags
+            for node in tree.css("script, style, noscript"):
+                node.decompose()
+            
+            # Extract text with newline separation
+            text = tree.text(separator="\n")
+        else:
+            soup = BeautifulSoup(body, "html.parser", from_encoding=charset)
+            
+            for tag in soup(["script", "style", "noscript"]):
+                tag.decompose()
+            
+            text = soup.get_text(separator="\n")
+        
+        # Clean up whitespace: strip every line and drop blank ones, iterating in C
+        text = "\n".join(filter(None, map(str.strip, text.splitlines())))
+        
+        if not text and truncated:
+            return _dumps({
+                "error": f"Page truncated at {len(body)} bytes before any readable text"
+            })
+        
+        # Truncate if needed
+        if len(text) > max_chars:
+            text = text[:max_chars] + "\n..."
         
-        return json.dumps({"items": formatted}, indent=2)
+        return _dumps({
+            "url": url,
+            "content": text
+        }, pretty=pretty)
         
     except Exception as e:
-        return json.dumps({"error": f"Search failed: {str(e)}"})
+        return _dumps({"error": f"Parse failed: {str(e)}"})
 
 
-@tool
-def fetch_url_content(url: str, max_chars: int = 8000) -> str:
+def _fetch_url_content(url: str, max_chars: int = 8000, pretty: bool = False) -> str:
     """Fetch URL and extract readable text content.
 
-    Uses requests and BeautifulSoup to retrieve webpage content,
+    Uses requests and selectolax (or BeautifulSoup) to retrieve webpage content,
     strips scripts/styles, and returns clean text.
     
     Args:
         url: URL to fetch
         max_chars: Maximum characters to return (default: 8000)
+        pretty: Indent the JSON output for human reading (default: False)
     
     Returns:
         JSON string with URL and extracted content or error message
     """
     try:
-        response = requests.get(
+        head = _SESSION.head(url, timeout=5, allow_redirects=True, headers=_BROWSER_HEADERS)
+        error = _check_fetchable(head.headers) if head.ok else None
+    except Exception:
+        error = None
+    if error:
+        return _dumps({"error": error})
+
+    cap = _download_cap(max_chars)
+    try:
+        with _SESSION.get(
             url,
+            stream=True,
             timeout=20,
-            headers={
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                             "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
-            }
-        )
-        response.raise_for_status()
+            headers=_BROWSER_HEADERS
+        ) as response:
+            response.raise_for_status()
+            
+            chunks = []
+            total = 0
+            truncated = False
+            for chunk in response.iter_content(_CHUNK_SIZE):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= cap:
+                    truncated = True
+                    break
+            body = b"".join(chunks)
+            
+            # requests defaults text/* to ISO-8859-1; only trust an explicit charset
+            content_type = response.headers.get("Content-Type", "")
+            charset = response.encoding if "charset" in content_type.lower() else None
         
     except Exception as e:
-        return json.dumps({"error": f"Request failed: {str(e)}"})
+        return _dumps({"error": f"Request failed: {str(e)}"})
+
+    return _extract_text(url, body, max_chars, charset, pretty, truncated)
 
+
+async def _fetch_url_content_async(url: str, max_chars: int = 8000, pretty: bool = False) -> str:
+    """Async variant of _fetch_url_content using the shared aiohttp session."""
+    session = await _get_aiohttp_session()
     try:
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # Remove script, style, and noscript tags
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
-        
-        # Extract text with newline separation
-        text = soup.get_text(separator="\n")
-        
-        # Clean up whitespace
-        text = "\n".join(
-            line.strip() 
-            for line in text.splitlines() 
-            if line.strip()
-        )
-        
-        # Truncate if needed
-        if len(text) > max_chars:
-            text = text[:max_chars] + "\n..."
-        
-        return json.dumps({
-            "url": url,
-            "content": text
-        }, indent=2)
+        async with session.head(
+            url,
+            allow_redirects=True,
+            timeout=aiohttp.ClientTimeout(total=5),
+            headers=_BROWSER_HEADERS
+        ) as head:
+            error = _check_fetchable(head.headers) if head.ok else None
+    except Exception:
+        error = None
+    if error:
+        return _dumps({"error": error})
+
+    cap = _download_cap(max_chars)
+    try:
+        async with session.get(
+            url,
+            timeout=aiohttp.ClientTimeout(total=20),
+            headers=_BROWSER_HEADERS
+        ) as response:
+            response.raise_for_status()
+            
+            chunks = []
+            total = 0
+            truncated = False
+            async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= cap:
+                    truncated = True
+                    break
+            body = b"".join(chunks)
+            charset = response.charset
         
     except Exception as e:
-        return json.dumps({"error": f"Parse failed: {str(e)}"})
+        return _dumps({"error": f"Request failed: {str(e)}"})
+
+    return _extract_text(url, body, max_chars, charset, pretty, truncated)
+
+
+fetch_url_content = StructuredTool.from_function(
+    func=_fetch_url_content,
+    coroutine=_fetch_url_content_async,
+    name="fetch_url_content",
+)
+
 
+##########################
+# Wikipedia Summaries
+##########################
+# Wikipedia REST summary endpoint; the title is appended as a single path segment
+_WIKIPEDIA_SUMMARY_PREFIX = "https://en.wikipedia.org/api/rest_v1/page/summary/"
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
 
-@tool
-def wikipedia_summary(topic: str, sentences: int = 3) -> str:
+
+def _format_wikipedia_summary(data: dict, topic: str, sentences: int, pretty: bool) -> str:
+    """Trim a Wikipedia REST summary payload to the requested sentence count."""
+    # Extract summary and limit to requested sentences
+    extract = data.get("extract", "")
+    if extract:
+        # Split into sentences (basic approach)
+        sentence_list = _SENTENCE_SPLIT.split(extract)
+        extract = " ".join(sentence_list[:sentences])
+    
+    result = {
+        "title": data.get("title", topic),
+        "summary": extract,
+        "url": data.get("content_urls", {}).get("desktop", {}).get("page", ""),
+        "thumbnail": data.get("thumbnail", {}).get("source", "") if "thumbnail" in data else None
+    }
+    
+    return _dumps(result, pretty=pretty)
+
+
+@_cached(_WIKIPEDIA_CACHE)
+def _wikipedia_summary(topic: str, sentences: int = 3, pretty: bool = False) -> str:
     """Get a summary of a Wikipedia article.
     
     Fetches the summary/introduction section of a Wikipedia article.
@@ -141,6 +737,7 @@ def wikipedia_summary(topic: str, sentences: int = 3) -> str:
     Args:
         topic: The Wikipedia article topic/title to look up
         sentences: Number of sentences to return in summary (default: 3, max: 10)
+        pretty: Indent the JSON output for human reading (default: False)
     
     Returns:
         JSON string with article title, summary, and URL, or error message
@@ -148,45 +745,146 @@ def wikipedia_summary(topic: str, sentences: int = 3) -> str:
     sentences = max(1, min(10, int(sentences)))
     
     try:
-        # Wikipedia API endpoint
-        api_url = "https://en.wikipedia.org/api/rest_v1/page/summary/" + urllib.parse.quote(topic)
-        
-        response = requests.get(
-            api_url,
+        response = _SESSION.get(
+            _WIKIPEDIA_SUMMARY_PREFIX + urllib.parse.quote(topic, safe=""),
             timeout=15,
-            headers={"User-Agent": "OpenDeepResearch/1.0"}
+            headers=_ODR_HEADERS
         )
         response.raise_for_status()
         
-        data = response.json()
-        
-        # Extract summary and limit to requested sentences
-        extract = data.get("extract", "")
-        if extract:
-            # Split into sentences (basic approach)
-            sentence_list = re.split(r'(?<=[.!?])\s+', extract)
-            extract = " ".join(sentence_list[:sentences])
+        data = _loads(response.content)
         
-        result = {
-            "title": data.get("title", topic),
-            "summary": extract,
-            "url": data.get("content_urls", {}).get("desktop", {}).get("page", ""),
-            "thumbnail": data.get("thumbnail", {}).get("source", "") if "thumbnail" in data else None
-        }
-        
-        return json.dumps(result, indent=2)
+        return _format_wikipedia_summary(data, topic, sentences, pretty)
         
     except requests.HTTPError as e:
-        if e.response.status_code == 404:
-            return json.dumps({"error": f"Wikipedia article not found for topic: {topic}"})
-        return json.dumps({"error": f"Wikipedia API error: {str(e)}"})
+        # HTTPError may be raised without a response attached
+        if getattr(e.response, "status_code", None) == 404:
+            return _dumps({"error": f"Wikipedia article not found for topic: {topic}"})
+        return _dumps({"error": f"Wikipedia API error: {str(e)}"})
     except Exception as e:
-        return json.dumps({"error": f"Failed to fetch Wikipedia summary: {str(e)}"})
-        return json.dumps({"error": f"Failed to fetch Wikipedia summary: {str(e)}"})
+        return _dumps({"error": f"Failed to fetch Wikipedia summary: {str(e)}"})
+
+
+@_cached(_WIKIPEDIA_CACHE)
+async def _wikipedia_summary_async(topic: str, sentences: int = 3, pretty: bool = False) -> str:
+    """Async variant of _wikipedia_summary using the shared aiohttp session."""
+    sentences = max(1, min(10, int(sentences)))
+    
+    try:
+        body = await _aget(
+            _WIKIPEDIA_SUMMARY_PREFIX + urllib.parse.quote(topic, safe=""),
+            timeout=15,
+            headers=_ODR_HEADERS,
+            cached=True
+        )
+        return _format_wikipedia_summary(_loads(body), topic, sentences, pretty)
+        
+    except aiohttp.ClientResponseError as e:
+        if e.status == 404:
+            return _dumps({"error": f"Wikipedia article not found for topic: {topic}"})
+        return _dumps({"error": f"Wikipedia API error: {str(e)}"})
+    except Exception as e:
+        return _dumps({"error": f"Failed to fetch Wikipedia summary: {str(e)}"})
+
+
+wikipedia_summary = StructuredTool.from_function(
+    func=_wikipedia_summary,
+    coroutine=_wikipedia_summary_async,
+    name="wikipedia_summary",
+)
+
+
+##########################
+# arXiv Search
+##########################
+# Only the query and result count vary between calls, so the rest of the
+# query string is encoded once here rather than by the HTTP client per request
+_ARXIV_QUERY_TEMPLATE = (
+    "http://export.arxiv.org/api/query"
+    "?search_query=all:%s&start=0&max_results=%d&sortBy=relevance&sortOrder=descending"
+)
+
+
+_ARXIV_NS = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'arxiv': 'http://arxiv.org/schemas/atom'
+}
+_NS_PREFIX = re.compile(r"\b(atom|arxiv):")
+
+
+def _compile_path(path: str):
+    """Compile a namespaced element path into a callable returning matching nodes.
+
+    Under lxml this is a precompiled XPath evaluated in a single C call; with the
+    stdlib fallback it is the equivalent ElementTree findall, with prefixes
+    expanded to qualified {uri}tag names up front.
+    """
+    if hasattr(ET, "XPath"):
+        return ET.XPath(path, namespaces=_ARXIV_NS)
+    qualified = _NS_PREFIX.sub(lambda m: "{" + _ARXIV_NS[m.group(1)] + "}", path)
+    return lambda node: node.findall(qualified)
+
+
+_XP_ENTRIES = _compile_path("atom:entry")
+_XP_TITLE = _compile_path("atom:title")
+_XP_SUMMARY = _compile_path("atom:summary")
+_XP_PUBLISHED = _compile_path("atom:published")
+_XP_UPDATED = _compile_path("atom:updated")
+_XP_AUTHOR_NAMES = _compile_path("atom:author/atom:name")
+_XP_PDF_LINKS = _compile_path("atom:link[@title='pdf']")
+_XP_ALTERNATE_LINKS = _compile_path("atom:link[@rel='alternate']")
+_XP_CATEGORIES = _compile_path("atom:category[@term]")
 
 
-@tool
-def arxiv_search(query: str, max_results: int = 5) -> str:
+def _first_text(nodes: list) -> str:
+    """Return the text of the first node, or an empty string."""
+    return (nodes[0].text or "") if nodes else ""
+
+
+def _format_arxiv_results(content: bytes, query: str, pretty: bool) -> str:
+    """Parse an arXiv Atom feed into paper metadata JSON."""
+    # Parse XML response
+    root = ET.fromstring(content)
+    
+    papers = []
+    for entry in _XP_ENTRIES(root):
+        # Extract links (PDF and abstract page)
+        pdf_links = [link.get('href') for link in _XP_PDF_LINKS(entry)]
+        abs_links = [
+            link.get('href')
+            for link in _XP_ALTERNATE_LINKS(entry)
+            if link.get('title') != 'pdf'
+        ]
+        pdf_link = pdf_links[-1] if pdf_links else None
+        abs_link = abs_links[-1] if abs_links else None
+        
+        # Extract arXiv ID from abstract link
+        arxiv_id = abs_link.split('/')[-1] if abs_link else None
+        
+        paper = {
+            "arxiv_id": arxiv_id,
+            "title": _first_text(_XP_TITLE(entry)).strip(),
+            "authors": [name.text for name in _XP_AUTHOR_NAMES(entry)],
+            "summary": _first_text(_XP_SUMMARY(entry)).strip(),
+            "published": _first_text(_XP_PUBLISHED(entry)),
+            "updated": _first_text(_XP_UPDATED(entry)),
+            "categories": [
+                term for term in (c.get('term') for c in _XP_CATEGORIES(entry)) if term
+            ],
+            "abstract_url": abs_link,
+            "pdf_url": pdf_link
+        }
+        papers.append(paper)
+    
+    return _dumps({
+        "query": query,
+        "total_results": len(papers),
+        "papers": papers
+    }, pretty=pretty)
+
+
+@_cached(_ARXIV_CACHE)
+def _arxiv_search(query: str, max_results: int = 5, pretty: bool = False) -> str:
     """Search arXiv for academic papers and preprints.
     
     Searches the arXiv repository for scientific papers across physics, mathematics,
@@ -203,6 +901,7 @@ def arxiv_search(query: str, max_results: int = 5) -> str:
     Args:
         query: Search query (can include keywords, author names, or arXiv IDs)
         max_results: Maximum number of papers to return (default: 5, max: 20)
+        pretty: Indent the JSON output for human reading (default: False)
     
     Returns:
         JSON string with paper metadata or error message
@@ -210,95 +909,48 @@ def arxiv_search(query: str, max_results: int = 5) -> str:
     max_results = max(1, min(20, int(max_results)))
     
     try:
-        # arXiv API endpoint
-        base_url = "http://export.arxiv.org/api/query"
-        params = {
-            "search_query": f"all:{query}",
-            "start": 0,
-            "max_results": max_results,
-            "sortBy": "relevance",
-            "sortOrder": "descending"
-        }
-        
-        response = requests.get(
-            base_url,
-            params=params,
+        response = _SESSION.get(
+            _ARXIV_QUERY_TEMPLATE % (urllib.parse.quote_plus(query), max_results),
             timeout=20,
-            headers={"User-Agent": "OpenDeepResearch/1.0"}
+            headers=_ODR_HEADERS
         )
         response.raise_for_status()
         
-        # Parse XML response
-        from xml.etree import ElementTree as ET
-        root = ET.fromstring(response.content)
-        
-        # Define namespaces
-        ns = {
-            'atom': 'http://www.w3.org/2005/Atom',
-            'arxiv': 'http://arxiv.org/schemas/atom'
-        }
-        
-        papers = []
-        for entry in root.findall('atom:entry', ns):
-            # Extract paper metadata
-            title = entry.find('atom:title', ns)
-            summary = entry.find('atom:summary', ns)
-            published = entry.find('atom:published', ns)
-            updated = entry.find('atom:updated', ns)
-            
-            # Extract authors
-            authors = []
-            for author in entry.findall('atom:author', ns):
-                name = author.find('atom:name', ns)
-                if name is not None:
-                    authors.append(name.text)
-            
-            # Extract links (PDF and abstract page)
-            pdf_link = None
-            abs_link = None
-            for link in entry.findall('atom:link', ns):
-                if link.get('title') == 'pdf':
-                    pdf_link = link.get('href')
-                elif link.get('rel') == 'alternate':
-                    abs_link = link.get('href')
-            
-            # Extract arXiv ID from abstract link
-            arxiv_id = abs_link.split('/')[-1] if abs_link else None
-            
-            # Extract categories
-            categories = []
-            for category in entry.findall('atom:category', ns):
-                term = category.get('term')
-                if term:
-                    categories.append(term)
-            
-            paper = {
-                "arxiv_id": arxiv_id,
-                "title": title.text.strip() if title is not None else "",
-                "authors": authors,
-                "summary": summary.text.strip() if summary is not None else "",
-                "published": published.text if published is not None else "",
-                "updated": updated.text if updated is not None else "",
-                "categories": categories,
-                "abstract_url": abs_link,
-                "pdf_url": pdf_link
-            }
-            papers.append(paper)
+        return _format_arxiv_results(response.content, query, pretty)
         
-        return json.dumps({
-            "query": query,
-            "total_results": len(papers),
-            "papers": papers
-        }, indent=2)
+    except Exception as e:
+        return _dumps({"error": f"arXiv search failed: {str(e)}"})
+
+
+@_cached(_ARXIV_CACHE)
+async def _arxiv_search_async(query: str, max_results: int = 5, pretty: bool = False) -> str:
+    """Async variant of _arxiv_search using the shared aiohttp session."""
+    max_results = max(1, min(20, int(max_results)))
+    
+    try:
+        body = await _aget(
+            _ARXIV_QUERY_TEMPLATE % (urllib.parse.quote_plus(query), max_results),
+            timeout=20,
+            headers=_ODR_HEADERS,
+            cached=True
+        )
+        return _format_arxiv_results(body, query, pretty)
         
     except Exception as e:
-        return json.dumps({"error": f"arXiv search failed: {str(e)}"})
+        return _dumps({"error": f"arXiv search failed: {str(e)}"})
+
+
+arxiv_search = StructuredTool.from_function(
+    func=_arxiv_search,
+    coroutine=_arxiv_search_async,
+    name="arxiv_search",
+)
 
 
 def get_custom_tools():
     """
     Get all custom tools for the research agent.
-    Conditionally includes Google CSE only if API credentials are available.
+    Conditionally includes Google CSE (single and batched) only if API credentials are available.
     
     Returns:
         List of custom tool instances
@@ -309,6 +961,6 @@ def get_custom_tools():
     google_api_key = os.getenv("GOOGLE_SEARCH_JSON_API_KEY")
     google_cse_id = os.getenv("GOOGLE_CSE_ID")
     if google_api_key and google_cse_id:
-        tools.insert(0, google_cse_search)
+        tools[:0] = [google_cse_search, batch_search]
     
     return tools
\ No newline at end of file